@@ -2,7 +2,8 @@
 
 This script is the final gate in CI. It reads the exported dashboard JSON
 and asserts structural and logical invariants. If anything is wrong, it
-exits non-zero and fails the build.
+exits non-zero and fails the build. The file is streamed rather than
+loaded whole, so memory use does not grow with the number of experiments.
 
 Usage:
     python ci/validate_analytics.py
@@ -10,13 +11,20 @@ Usage:
 """
 
 import argparse
-import json
+import itertools
 import sys
+from collections.abc import Iterable, Iterator
+from enum import Enum
 from pathlib import Path
 
-REQUIRED_TOP_KEYS = {"funnel", "experiments", "event_summary"}
-FUNNEL_STEPS = ["page_view", "signup", "purchase"]
-ANALYSIS_FIELDS = {
+import ijson
+import numpy as np
+
+# Ordered, so missing-key and missing-type errors are reported in a stable order
+REQUIRED_TOP_KEYS = ("funnel", "experiments", "event_summary")
+FUNNEL_STEPS = ("page_view", "signup", "purchase")
+REQUIRED_EVENT_TYPES = ("page_view", "signup", "purchase")
+ANALYSIS_FIELDS = frozenset({
     "absolute_uplift",
     "relative_uplift",
     "p_value",
@@ -25,100 +33,264 @@ ANALYSIS_FIELDS = {
     "is_significant",
     "decision",
     "reason",
-}
+})
+VALID_DECISIONS = frozenset({"SHIP", "DO NOT SHIP", "INCONCLUSIVE"})
+
+
+class ErrCode(str, Enum):
+    """Machine-readable category of a validation error."""
+
+    MISSING_TOP_KEY = "missing_top_key"
+    EMPTY_EVENT_SUMMARY = "empty_event_summary"
+    MISSING_EVENT_TYPE = "missing_event_type"
+    NON_POSITIVE_COUNT = "non_positive_count"
+    EMPTY_FUNNEL = "empty_funnel"
+    UNEXPECTED_FUNNEL_STEPS = "unexpected_funnel_steps"
+    INVALID_FUNNEL_USERS = "invalid_funnel_users"
+    FUNNEL_NOT_MONOTONIC = "funnel_not_monotonic"
+    INVALID_CONVERSION_RATE = "invalid_conversion_rate"
+    EMPTY_EXPERIMENTS = "empty_experiments"
+    NO_VARIANTS = "no_variants"
+    MISSING_VARIANT = "missing_variant"
+    EMPTY_VARIANT = "empty_variant"
+    MISSING_ANALYSIS = "missing_analysis"
+    MISSING_ANALYSIS_FIELDS = "missing_analysis_fields"
+    P_VALUE_OUT_OF_RANGE = "p_value_out_of_range"
+    INVALID_DECISION = "invalid_decision"
+
+
+class ErrorMessage(str):
+    """A validation error message tagged with its ErrCode.
 
+    Behaves as the plain message string everywhere else, so printing and
+    comparing errors is unchanged.
+    """
 
-def validate(data: dict) -> list[str]:
-    """Return a list of validation errors (empty = pass)."""
-    errors = []
+    def __new__(cls, code: ErrCode, message: str):
+        self = super().__new__(cls, message)
+        self.code = code
+        return self
 
-    # --- Top-level structure ---
-    for key in REQUIRED_TOP_KEYS:
-        if key not in data:
-            errors.append(f"Missing top-level key: {key}")
 
+class ErrorList(list):
+    """List of ErrorMessage returned by validate() and validate_stream()."""
+
+    @property
+    def codes(self) -> set[ErrCode]:
+        return {e.code for e in self}
+
+
+def validate(data: dict, fail_fast: bool = False) -> ErrorList:
+    """Return a list of validation errors (empty = pass).
+
+    Each error is a message string carrying an ErrCode in .code; the
+    list's .codes gives the set of codes raised. With fail_fast=True,
+    stop at the first error and return only that one.
+    """
+    errors = _check_top_keys(data.keys())
     if errors:
-        return errors  # Can't continue without structure
+        # Can't continue without structure
+        return ErrorList(errors[:1]) if fail_fast else errors
+
+    # Checks yield errors lazily, so fail_fast skips the remaining work
+    checks = itertools.chain(
+        _check_event_summary(data["event_summary"]),
+        _check_funnel(data["funnel"]),
+        _check_experiments(data["experiments"]),
+    )
+    if fail_fast:
+        return ErrorList(itertools.islice(checks, 1))
+    return ErrorList(checks)
+
+
+def validate_stream(path: Path) -> ErrorList:
+    """Validate a dashboard JSON file without loading it all into memory.
+
+    Returns the same errors as validate(). The file is streamed with ijson:
+    one pass collects the top-level keys, then each section is re-read on
+    its own, and experiments are checked one at a time.
+    """
+    with path.open("rb") as f:
+        keys = [
+            value for prefix, event, value in ijson.parse(f)
+            if prefix == "" and event == "map_key"
+        ]
+        errors = _check_top_keys(keys)
+        if errors:
+            return errors
+
+        f.seek(0)
+        errors.extend(_check_event_summary(list(_stream_items(f, "event_summary"))))
+        f.seek(0)
+        errors.extend(_check_funnel(list(_stream_items(f, "funnel"))))
+        f.seek(0)
+        errors.extend(_check_experiments(_stream_items(f, "experiments")))
+
+    return errors
+
+
+def _stream_items(f, key: str):
+    return ijson.items(f, f"{key}.item", use_float=True)
+
+
+def _check_top_keys(keys) -> ErrorList:
+    present = set(keys)
+    return ErrorList(
+        ErrorMessage(ErrCode.MISSING_TOP_KEY, f"Missing top-level key: {key}")
+        for key in REQUIRED_TOP_KEYS
+        if key not in present
+    )
+
 
-    # --- Event summary ---
-    summary = data["event_summary"]
+def _check_event_summary(summary: list[dict]) -> Iterator[ErrorMessage]:
     if not summary:
-        errors.append("event_summary is empty — no events were generated")
-    else:
-        event_types = {item["event_type"] for item in summary}
-        for required in ("page_view", "signup", "purchase"):
-            if required not in event_types:
-                errors.append(f"event_summary missing required type: {required}")
-
-        for item in summary:
-            if item["count"] <= 0:
-                errors.append(f"event_summary {item['event_type']} has count <= 0")
-
-    # --- Funnel ---
-    funnel = data["funnel"]
+        yield ErrorMessage(
+            ErrCode.EMPTY_EVENT_SUMMARY,
+            "event_summary is empty — no events were generated",
+        )
+        return
+
+    event_types = {item["event_type"] for item in summary}
+    for required in REQUIRED_EVENT_TYPES:
+        if required not in event_types:
+            yield ErrorMessage(
+                ErrCode.MISSING_EVENT_TYPE,
+                f"event_summary missing required type: {required}",
+            )
+
+    for item in summary:
+        if item["count"] <= 0:
+            yield ErrorMessage(
+                ErrCode.NON_POSITIVE_COUNT,
+                f"event_summary {item['event_type']} has count <= 0",
+            )
+
+
+def _check_funnel(funnel: list[dict]) -> Iterator[ErrorMessage]:
     if not funnel:
-        errors.append("funnel is empty — no funnel data exported")
-    else:
-        steps = [s["step"] for s in funnel]
-        if steps != FUNNEL_STEPS:
-            errors.append(f"Funnel steps {steps} != expected {FUNNEL_STEPS}")
-
-        users = [s["users"] for s in funnel]
-        for i in range(1, len(users)):
-            if users[i] > users[i - 1]:
-                errors.append(
-                    f"Funnel not monotonically decreasing: "
-                    f"{funnel[i-1]['step']}={users[i-1]} < {funnel[i]['step']}={users[i]}"
-                )
-
-        for step in funnel:
-            pct = step["conversion_rate_pct"]
-            if pct < 0 or pct > 100:
-                errors.append(f"Funnel step {step['step']} has invalid rate: {pct}%")
-
-    # --- Experiments ---
-    experiments = data["experiments"]
-    if not experiments:
-        errors.append("experiments is empty — no experiment data exported")
-    else:
-        for exp in experiments:
-            exp_id = exp.get("experiment_id", "UNKNOWN")
-
-            if not exp.get("variants"):
-                errors.append(f"Experiment {exp_id} has no variants")
-                continue
-
-            variant_names = {v["name"] for v in exp["variants"]}
-            if "control" not in variant_names:
-                errors.append(f"Experiment {exp_id} missing 'control' variant")
-            if "treatment" not in variant_names:
-                errors.append(f"Experiment {exp_id} missing 'treatment' variant")
-
-            for v in exp["variants"]:
-                if v["users"] <= 0:
-                    errors.append(f"Experiment {exp_id} variant {v['name']} has 0 users")
-
-            # Analysis must be present
-            analysis = exp.get("analysis")
-            if analysis is None:
-                errors.append(f"Experiment {exp_id} missing analysis results")
-                continue
-
-            missing = ANALYSIS_FIELDS - set(analysis.keys())
-            if missing:
-                errors.append(f"Experiment {exp_id} analysis missing fields: {missing}")
-
-            if analysis.get("p_value") is not None:
-                p = analysis["p_value"]
-                if p < 0 or p > 1:
-                    errors.append(f"Experiment {exp_id} p-value out of range: {p}")
-
-            if analysis.get("decision") not in ("SHIP", "DO NOT SHIP", "INCONCLUSIVE"):
-                errors.append(
-                    f"Experiment {exp_id} invalid decision: {analysis.get('decision')}"
-                )
+        yield ErrorMessage(ErrCode.EMPTY_FUNNEL, "funnel is empty — no funnel data exported")
+        return
+
+    steps = tuple(s["step"] for s in funnel)
+    if steps != FUNNEL_STEPS:
+        yield ErrorMessage(
+            ErrCode.UNEXPECTED_FUNNEL_STEPS,
+            f"Funnel steps {list(steps)} != expected {list(FUNNEL_STEPS)}",
+        )
+
+    # One vectorized comparison per check; Python only visits failing
+    # steps. float64 rather than int64 so non-integer counts aren't truncated.
+    n = len(funnel)
+    users = np.fromiter((_as_number(s["users"]) for s in funnel), dtype=np.float64, count=n)
+    invalid_users = np.isnan(users)
+    if invalid_users.any():
+        for i in np.flatnonzero(invalid_users).tolist():
+            yield ErrorMessage(
+                ErrCode.INVALID_FUNNEL_USERS,
+                f"Funnel step {funnel[i]['step']} has invalid user count: {funnel[i]['users']}",
+            )
+
+    # NaN compares False, so invalid counts add no monotonicity errors
+    increased = np.diff(users) > 0
+    if increased.any():
+        for i in (np.flatnonzero(increased) + 1).tolist():
+            prev, cur = funnel[i - 1], funnel[i]
+            yield ErrorMessage(
+                ErrCode.FUNNEL_NOT_MONOTONIC,
+                f"Funnel not monotonically decreasing: "
+                f"{prev['step']}={prev['users']} < {cur['step']}={cur['users']}",
+            )
+
+    rates = np.fromiter(
+        (_as_number(s["conversion_rate_pct"]) for s in funnel), dtype=np.float64, count=n,
+    )
+    invalid = np.isnan(rates) | (rates < 0) | (rates > 100)
+    if invalid.any():
+        for i in np.flatnonzero(invalid).tolist():
+            pct = funnel[i]["conversion_rate_pct"]
+            yield ErrorMessage(
+                ErrCode.INVALID_CONVERSION_RATE,
+                f"Funnel step {funnel[i]['step']} has invalid rate: {pct}%",
+            )
+
+
+def _as_number(value) -> float:
+    # NaN for anything that is not a JSON number, so null and numeric
+    # strings are flagged rather than silently coerced by np.fromiter
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    return np.nan
 
-    return errors
+
+def _check_experiments(experiments: Iterable[dict]) -> Iterator[ErrorMessage]:
+    seen_experiment = False
+    # A null "experiments" is reported like an empty one
+    for exp in experiments or ():
+        seen_experiment = True
+        yield from _check_experiment(exp)
+    if not seen_experiment:
+        yield ErrorMessage(
+            ErrCode.EMPTY_EXPERIMENTS,
+            "experiments is empty — no experiment data exported",
+        )
+
+
+def _check_experiment(exp: dict) -> Iterator[ErrorMessage]:
+    exp_id = exp.get("experiment_id", "UNKNOWN")
+
+    if not exp.get("variants"):
+        yield ErrorMessage(ErrCode.NO_VARIANTS, f"Experiment {exp_id} has no variants")
+        return
+
+    variant_names = {v["name"] for v in exp["variants"]}
+    if "control" not in variant_names:
+        yield ErrorMessage(
+            ErrCode.MISSING_VARIANT,
+            f"Experiment {exp_id} missing 'control' variant",
+        )
+    if "treatment" not in variant_names:
+        yield ErrorMessage(
+            ErrCode.MISSING_VARIANT,
+            f"Experiment {exp_id} missing 'treatment' variant",
+        )
+
+    for v in exp["variants"]:
+        if v["users"] <= 0:
+            yield ErrorMessage(
+                ErrCode.EMPTY_VARIANT,
+                f"Experiment {exp_id} variant {v['name']} has 0 users",
+            )
+
+    # Analysis must be present
+    analysis = exp.get("analysis")
+    if analysis is None:
+        yield ErrorMessage(
+            ErrCode.MISSING_ANALYSIS,
+            f"Experiment {exp_id} missing analysis results",
+        )
+        return
+
+    missing = ANALYSIS_FIELDS.difference(analysis)
+    if missing:
+        fields = ", ".join(sorted(missing))
+        yield ErrorMessage(
+            ErrCode.MISSING_ANALYSIS_FIELDS,
+            f"Experiment {exp_id} analysis missing fields: {fields}",
+        )
+
+    if analysis.get("p_value") is not None:
+        p = analysis["p_value"]
+        if p < 0 or p > 1:
+            yield ErrorMessage(
+                ErrCode.P_VALUE_OUT_OF_RANGE,
+                f"Experiment {exp_id} p-value out of range: {p}",
+            )
+
+    if analysis.get("decision") not in VALID_DECISIONS:
+        yield ErrorMessage(
+            ErrCode.INVALID_DECISION,
+            f"Experiment {exp_id} invalid decision: {analysis.get('decision')}",
+        )
 
 
 def main() -> None:
@@ -135,8 +307,7 @@ def main() -> None:
         print(f"FAIL: {opts.data} not found. Run 'python -m src.analysis.export' first.")
         sys.exit(1)
 
-    data = json.loads(path.read_text())
-    errors = validate(data)
+    errors = validate_stream(path)
 
     if errors:
         print(f"FAIL: {len(errors)} validation error(s):")
@@ -145,17 +316,19 @@ def main() -> None:
         sys.exit(1)
 
     # Print summary on success
-    summary = data["event_summary"]
-    total_events = sum(item["count"] for item in summary)
-    funnel = data["funnel"]
-    experiments = data["experiments"]
-
-    print("PASS: Analytics integrity validated")
-    print(f"  Events: {total_events:,}")
-    print(f"  Funnel: {funnel[0]['users']:,} -> {funnel[-1]['users']:,} users")
-    for exp in experiments:
-        a = exp["analysis"]
-        print(f"  Experiment {exp['experiment_id']}: {a['decision']} (p={a['p_value']:.4f})")
+    with path.open("rb") as f:
+        total_events = sum(item["count"] for item in _stream_items(f, "event_summary"))
+        f.seek(0)
+        funnel = list(_stream_items(f, "funnel"))
+
+        print("PASS: Analytics integrity validated")
+        print(f"  Events: {total_events:,}")
+        print(f"  Funnel: {funnel[0]['users']:,} -> {funnel[-1]['users']:,} users")
+
+        f.seek(0)
+        for exp in _stream_items(f, "experiments"):
+            a = exp["analysis"]
+            print(f"  Experiment {exp['experiment_id']}: {a['decision']} (p={a['p_value']:.4f})")
 
 
 if __name__ == "__main__":
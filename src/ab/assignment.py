@@ -11,6 +11,9 @@ This guarantees:
 """
 
 import hashlib
+from collections.abc import Iterable
+
+import numpy as np
 
 from src.ab.experiment import Experiment
 
@@ -35,3 +38,30 @@ def assign_variant(experiment: Experiment, user_id: str) -> str:
 
     # Fallback to last variant (handles floating point edge cases)
     return experiment.variants[-1].name
+
+
+def assign_variants_bulk(experiment: Experiment, user_ids: Iterable[str]) -> np.ndarray:
+    """Assign many users at once; equivalent to calling assign_variant per user.
+
+    The SHA-256 state for the "experiment_id:" prefix is computed once and
+    copied per user, and the bucket-to-variant mapping is a single
+    vectorized searchsorted over the cumulative weights.
+    """
+    base = hashlib.sha256(f"{experiment.experiment_id}:".encode())
+    digests = []
+    for user_id in user_ids:
+        h = base.copy()
+        h.update(user_id.encode())
+        digests.append(h.digest())
+
+    names = np.array([v.name for v in experiment.variants])
+    if not digests:
+        return names[:0]
+
+    raw = np.frombuffer(b"".join(digests), dtype=np.uint8).reshape(-1, 32)
+    # First 8 bytes of each digest as a big-endian uint64, normalized to [0, 1)
+    buckets = raw[:, :8].copy().view(">u8").ravel() / (2**64)
+    cumulative = np.cumsum([v.weight for v in experiment.variants])
+    idx = np.searchsorted(cumulative, buckets, side="right")
+    # Clamp to the last variant (handles floating point edge cases)
+    return names[np.minimum(idx, len(names) - 1)]
@@ -10,7 +10,7 @@ for statistical analysis while remaining realistic.
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SimulationConfig:
     num_users: int = 2000
     # Number of days the simulation spans
@@ -6,21 +6,88 @@ Each simulated user progresses through a funnel:
 At each stage, the user may drop off based on configured probabilities.
 Treatment variant users get a configurable uplift to purchase probability.
 All randomness is seeded for full reproducibility.
+
+Two code paths produce events with the same shape and distributions:
+the default vectorized path draws every random decision for all users
+at once with NumPy, while the per-user legacy path walks each journey
+with ``random.Random`` and is kept for comparison in tests.
 """
 
-import hashlib
+import binascii
+import bisect
+import itertools
+import json
 import random
-from datetime import datetime, timedelta, timezone
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta, timezone
+from functools import cache, lru_cache
+from operator import attrgetter
+from typing import NamedTuple
+
+import numpy as np
+from pydantic import TypeAdapter
 
-from src.ab.assignment import assign_variant
+from src.ab.assignment import assign_variant, assign_variants_bulk
 from src.ab.experiment import Experiment
 from src.collector.schemas import Event, EventType
 from src.simulator.config import SimulationConfig
 
+_SECONDS_PER_DAY = 86400
+
+# Inclusive (low, high) bounds in seconds for each in-session wait
+_PAGE_VIEW_DELAY = (5, 120)      # after each browsing page view
+_CLICK_DELAY = (2, 30)           # after each click
+_ASSIGNMENT_DELAY = (1, 10)      # before the experiment assignment
+_SIGNUP_DELAY = (10, 300)        # before signup
+_ONBOARDING_DELAY = (60, 3600)   # before the first dashboard view
+_DASHBOARD_DELAY = (10, 180)     # after each dashboard view
+_PURCHASE_DELAY = (30, 600)      # before purchase
+# Inclusive range of dashboard views for onboarded users
+_DASHBOARD_VIEWS = (2, 5)
+
+# Journey slots of the vectorized path, in the order they occur per user
+(
+    _SLOT_PAGE_VIEW,
+    _SLOT_CLICK,
+    _SLOT_ASSIGNMENT,
+    _SLOT_SIGNUP,
+    _SLOT_DASHBOARD,
+    _SLOT_PURCHASE,
+) = range(6)
+_SLOT_EVENT_TYPES = (
+    EventType.PAGE_VIEW,
+    EventType.CLICK,
+    EventType.EXPERIMENT_ASSIGNMENT,
+    EventType.SIGNUP,
+    EventType.PAGE_VIEW,
+    EventType.PURCHASE,
+)
+_NO_DELAY = (0, 0)
+# Per-slot delay bounds, waited before ("pre") and after ("post") each slot
+_PRE_DELAY_LOW, _PRE_DELAY_HIGH = np.array([
+    _NO_DELAY, _NO_DELAY, _ASSIGNMENT_DELAY,
+    _SIGNUP_DELAY, _ONBOARDING_DELAY, _PURCHASE_DELAY,
+]).T
+_POST_DELAY_LOW, _POST_DELAY_HIGH = np.array([
+    _PAGE_VIEW_DELAY, _CLICK_DELAY, _NO_DELAY,
+    _NO_DELAY, _DASHBOARD_DELAY, _NO_DELAY,
+]).T
+
+_SLOT_TYPE_STRINGS = np.array([t.value for t in _SLOT_EVENT_TYPES])
+
+_EVENT_LIST = TypeAdapter(list[Event])
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+_SIGNUP_PROPS = {"source": "web"}
+_DASHBOARD_PROPS = {"page": "/dashboard"}
+
 
 def generate_events(
     config: SimulationConfig | None = None,
     experiment: Experiment | None = None,
+    *,
+    vectorized: bool = True,
 ) -> list[Event]:
     """Generate a full set of simulated user events.
 
@@ -28,30 +95,395 @@ def generate_events(
     to a variant and an experiment_assignment event is emitted.
     Treatment users receive a purchase probability uplift.
 
+    Pass vectorized=False to use the per-user legacy simulation. Both paths
+    are deterministic for a given seed, but draw from different random
+    streams, so they do not produce identical events.
+
     Returns a list of Event objects sorted by timestamp.
     """
+    if vectorized:
+        return generate_events_frame(config, experiment).to_events()
+
     if config is None:
         config = SimulationConfig()
-
+    start_time = _window_start(config)
     rng = random.Random(config.seed)
-    all_events: list[Event] = []
+    per_user = [
+        _simulate_user_journey_legacy(
+            f"user_{i:05d}", start_time, config, rng, experiment,
+        )
+        for i in range(config.num_users)
+    ]
+    all_events = list(itertools.chain.from_iterable(per_user))
+    all_events.sort(key=attrgetter("timestamp"))
+    return all_events
+
+
+def generate_events_frame(
+    config: SimulationConfig | None = None,
+    experiment: Experiment | None = None,
+) -> "EventsFrame":
+    """Generate the same events as generate_events(), as columns.
+
+    Skips building an Event per row; use EventsFrame.to_events() when
+    validated Event objects are needed.
+    """
+    columns, props_code, props_pool = _simulate_columns(config, experiment)
+    pool = np.array(props_pool, dtype=object)
+    return EventsFrame(
+        **columns,
+        # A fresh dict per row: the pool dicts are shared and cached
+        properties=[dict(p) for p in pool[props_code].tolist()],
+    )
+
+
+def generate_event_columns(
+    config: SimulationConfig | None = None,
+    experiment: Experiment | None = None,
+) -> dict[str, np.ndarray]:
+    """Generate events as column arrays, without building Event objects.
+
+    Produces the same events as generate_events() for the same seed, in the
+    layout insert_event_columns() loads: the EventsFrame columns with
+    event_id and event_type as object arrays of str, and properties as JSON
+    strings. Meant for bulk export, where per-event validation buys nothing
+    because every value was generated here.
+    """
+    columns, props_code, props_pool = _simulate_columns(config, experiment)
+    # Serialize each distinct properties dict once, then gather per row
+    props_json = np.array([json.dumps(p) for p in props_pool], dtype=object)
+    return {
+        "event_id": columns["event_id"].astype(object),
+        "user_id": columns["user_id"],
+        "event_type": columns["event_type"].astype(object),
+        "timestamp": columns["timestamp"],
+        "properties": props_json[props_code],
+    }
+
+
+def _simulate_columns(
+    config: SimulationConfig | None,
+    experiment: Experiment | None,
+) -> tuple[dict[str, np.ndarray], np.ndarray, tuple[dict, ...]]:
+    """Run the batch simulation and lay out its non-properties columns.
+
+    Returns the EventsFrame columns other than properties, plus the
+    dictionary-encoded properties as (codes, pool). Both public column
+    layouts are built from this, so they cannot drift apart.
+    """
+    if config is None:
+        config = SimulationConfig()
+    start_time = _window_start(config)
+    batch = _simulate_batch(config, np.random.default_rng(config.seed), experiment)
+    columns = {
+        "event_id": np.array(batch.event_id),
+        "user_id": batch.user_id,
+        "event_type": _SLOT_TYPE_STRINGS[batch.slot],
+        "timestamp": _timestamps_us(start_time, batch.offset),
+    }
+    return columns, batch.props_code, batch.props_pool
+
+
+@dataclass(frozen=True, eq=False)
+class EventsFrame:
+    """Simulated events as parallel columns, sorted by timestamp.
+
+    event_id and event_type (EventType values) are fixed-width string
+    columns and timestamp is datetime64[us] in UTC. Each row owns its
+    properties dict. Iterating yields one EventView per row.
+    """
+
+    event_id: np.ndarray
+    user_id: np.ndarray
+    event_type: np.ndarray
+    timestamp: np.ndarray
+    properties: list[dict]
+
+    def __len__(self) -> int:
+        return len(self.event_id)
+
+    def __iter__(self) -> Iterator["EventView"]:
+        return (EventView(self, i) for i in range(len(self)))
+
+    def by_type(self, event_type: EventType) -> np.ndarray:
+        """Boolean mask of the rows with the given event type."""
+        # Compare on .value: NumPy would convert the enum member via str()
+        return self.event_type == EventType(event_type).value
+
+    def to_events(self) -> list[Event]:
+        """Materialize every row as a validated Event."""
+        # Validate the whole list in one pydantic-core call rather than
+        # running Event.__init__ once per event
+        return _EVENT_LIST.validate_python([
+            {
+                "event_id": event_id,
+                "user_id": user_id,
+                "event_type": event_type,
+                "timestamp": _EPOCH + timedelta(microseconds=us),
+                "properties": props,
+            }
+            for event_id, user_id, event_type, us, props in zip(
+                self.event_id.tolist(),
+                self.user_id.tolist(),
+                self.event_type.tolist(),
+                self.timestamp.astype(np.int64).tolist(),
+                self.properties,
+            )
+        ])
+
+
+class EventView:
+    """Read-only, Event-like view of one EventsFrame row."""
+
+    __slots__ = ("_frame", "_row")
+
+    def __init__(self, frame: EventsFrame, row: int):
+        self._frame = frame
+        self._row = row
+
+    @property
+    def event_id(self) -> str:
+        return str(self._frame.event_id[self._row])
+
+    @property
+    def user_id(self) -> str:
+        return self._frame.user_id[self._row]
+
+    @property
+    def event_type(self) -> EventType:
+        return EventType(self._frame.event_type[self._row])
+
+    @property
+    def timestamp(self) -> datetime:
+        us = int(self._frame.timestamp[self._row].astype(np.int64))
+        return _EPOCH + timedelta(microseconds=us)
+
+    @property
+    def properties(self) -> dict:
+        return self._frame.properties[self._row]
+
+
+def _timestamps_us(start_time: datetime, offset: np.ndarray) -> np.ndarray:
+    """Absolute datetime64[us] (UTC) timestamps from second offsets."""
+    start_us = np.datetime64((start_time - _EPOCH) // _MICROSECOND, "us")
+    return start_us + offset.astype("timedelta64[s]")
+
+
+def _window_start(config: SimulationConfig) -> datetime:
     # End the simulation window 1 day before now to avoid future timestamps
     # (user journeys can add ~2 hours of in-session time)
     end_time = datetime.now(timezone.utc) - timedelta(days=1)
-    start_time = end_time - timedelta(days=config.days)
+    return end_time - timedelta(days=config.days)
+
+
+class _BatchColumns(NamedTuple):
+    """Simulated events as parallel columns, sorted by time.
+
+    Properties are dictionary-encoded: props_code indexes into props_pool,
+    which holds one dict per distinct properties value.
+    """
+
+    event_id: list[str]
+    user_id: np.ndarray      # object array of user ID strings
+    slot: np.ndarray         # journey slot per event (see _SLOT_*)
+    offset: np.ndarray       # int64 seconds since the window start
+    props_code: np.ndarray
+    props_pool: tuple[dict, ...]
+
 
-    for i in range(config.num_users):
-        user_id = f"user_{i:05d}"
-        user_events = _simulate_user_journey(
-            user_id, start_time, config, rng, experiment,
+def _simulate_batch(
+    config: SimulationConfig,
+    rng: np.random.Generator,
+    experiment: Experiment | None = None,
+) -> _BatchColumns:
+    """Simulate every user's journey and pack it into event columns.
+
+    Wraps _simulate_core(): assigns variants up front, then maps the
+    core's integer codes onto user IDs, property dicts and event IDs.
+    """
+    n = config.num_users
+    user_ids = np.array([f"user_{i:05d}" for i in range(n)], dtype=object)
+
+    variant_idx = np.zeros(n, dtype=np.int64)
+    is_treatment = np.zeros(n, dtype=bool)
+    variant_props = ()
+    if experiment is not None:
+        names = [v.name for v in experiment.variants]
+        index_of = {name: i for i, name in enumerate(names)}
+        variants = assign_variants_bulk(experiment, user_ids.tolist())
+        variant_idx = np.array([index_of[v] for v in variants.tolist()], dtype=np.int64)
+        is_treatment = variants == "treatment"
+        variant_props = tuple(
+            {"experiment_id": experiment.experiment_id, "variant": name}
+            for name in names
         )
-        all_events.extend(user_events)
 
-    all_events.sort(key=lambda e: e.timestamp)
-    return all_events
+    core = _simulate_core(config, rng, is_treatment, variant_idx, experiment is not None)
+
+    # Properties are codes into one pool of shared dicts, laid out slot by
+    # slot; a slot's base offset plus the core's per-slot choice gives the code
+    pools = _property_pools(config)
+    slot_pools = (
+        pools.pages, pools.targets, variant_props,
+        (_SIGNUP_PROPS,), (_DASHBOARD_PROPS,), pools.plans,
+    )
+    slot_base = np.cumsum([0, *map(len, slot_pools[:-1])])
+
+    return _BatchColumns(
+        event_id=_batch_event_ids(rng, len(core.slot)),
+        user_id=user_ids[core.user],
+        slot=core.slot,
+        offset=core.offset,
+        props_code=slot_base[core.slot] + core.choice,
+        props_pool=tuple(itertools.chain.from_iterable(slot_pools)),
+    )
+
+
+class _CoreArrays(NamedTuple):
+    """Output of _simulate_core(): one entry per event, sorted by time."""
+
+    user: np.ndarray    # user index
+    slot: np.ndarray    # journey slot (see _SLOT_*)
+    offset: np.ndarray  # int64 seconds since the window start
+    choice: np.ndarray  # index into the slot's property pool
+
 
+def _simulate_core(
+    config: SimulationConfig,
+    rng: np.random.Generator,
+    is_treatment: np.ndarray,
+    variant_idx: np.ndarray,
+    with_assignment: bool,
+) -> _CoreArrays:
+    """Simulate every user's journey with bulk NumPy draws.
+
+    Each user's journey is laid out as a fixed sequence of slots (page
+    views, clicks, assignment, signup, dashboard views, purchase) whose
+    repeat counts are drawn per user. Event timestamps are integer second
+    offsets accumulated with a per-user cumulative sum. Purely numeric:
+    integer codes in and out, with no Python-level loop over users or events.
+    """
+    n = config.num_users
+    arrival = rng.integers(0, config.days * _SECONDS_PER_DAY, size=n, endpoint=True)
+
+    # --- Event layout: one row per event, grouped by user in journey order ---
+    counts = _funnel_kernel(config, rng, is_treatment, with_assignment)
+    per_user = counts.sum(axis=1)
+    slot = np.repeat(np.tile(np.arange(len(_SLOT_EVENT_TYPES)), n), counts.ravel())
+    user = np.repeat(np.arange(n), per_user)
+    starts = np.cumsum(per_user) - per_user
+
+    # Every per-event draw comes from one uniform block, one row each for
+    # the pre delay, the post delay and the property choice; discrete
+    # values are read off by inverse CDF
+    pre_u, post_u, choice_u = rng.random((3, len(slot)))
+
+    # --- Timestamps: integer seconds since the window start ---
+    # Every slot waits a "pre" delay before it is emitted and a "post" delay
+    # after it; the onboarding wait only precedes the first dashboard view.
+    pre = _uniform_integers(pre_u, _PRE_DELAY_LOW[slot], _PRE_DELAY_HIGH[slot])
+    is_dashboard = slot == _SLOT_DASHBOARD
+    first_dashboard = is_dashboard.copy()
+    first_dashboard[1:] &= ~is_dashboard[:-1]
+    pre[is_dashboard & ~first_dashboard] = 0
+    post = _uniform_integers(post_u, _POST_DELAY_LOW[slot], _POST_DELAY_HIGH[slot])
+    step = pre.copy()
+    step[1:] += post[:-1]
+    # A user's first event only waits its own pre delay
+    first = starts[per_user > 0]
+    step[first] = pre[first]
+    elapsed = np.cumsum(step)
+    before = np.concatenate(([0], elapsed))[starts]
+    offset = arrival[user] + elapsed - np.repeat(before, per_user)
+
+    # --- Property choices; signup and dashboard views have a single option ---
+    options = np.ones(len(_SLOT_EVENT_TYPES), dtype=np.int64)
+    options[_SLOT_PAGE_VIEW] = len(config.pages)
+    options[_SLOT_CLICK] = len(config.click_targets)
+    choice = _uniform_integers(choice_u, 0, options[slot] - 1)
+    assigned = slot == _SLOT_ASSIGNMENT
+    choice[assigned] = variant_idx[user[assigned]]
+    purchased = slot == _SLOT_PURCHASE
+    plan_cdf = np.cumsum(config.plan_weights, dtype=float)
+    choice[purchased] = np.minimum(
+        np.searchsorted(plan_cdf / plan_cdf[-1], choice_u[purchased], side="right"),
+        len(config.plans) - 1,
+    )
+
+    order = _time_order(offset)
+    return _CoreArrays(user[order], slot[order], offset[order], choice[order])
+
+
+def _uniform_integers(
+    u: np.ndarray, low: np.ndarray | int, high: np.ndarray | int,
+) -> np.ndarray:
+    """Map uniforms in [0, 1) to integers in [low, high], inclusive."""
+    width = high - low
+    # Clamp: u * (width + 1) can round up to width + 1 when u is just below 1
+    return low + np.minimum((u * (width + 1)).astype(np.int64), width)
+
+
+def _time_order(offset: np.ndarray) -> np.ndarray:
+    """Return the stable sort order of non-negative integer offsets.
+
+    Packs each offset with its row index into one int64 key, so a plain
+    (SIMD-vectorized) np.sort of distinct keys yields the stable order,
+    several times faster than a stable argsort. Falls back to argsort if
+    the packed key would not fit.
+    """
+    index_bits = max(len(offset) - 1, 1).bit_length()
+    if len(offset) == 0 or int(offset.max()).bit_length() + index_bits > 62:
+        return np.argsort(offset, kind="stable")
+    keys = (offset << index_bits) | np.arange(len(offset))
+    keys.sort()
+    return keys & ((1 << index_bits) - 1)
 
-def _simulate_user_journey(
+
+def _funnel_kernel(
+    config: SimulationConfig,
+    rng: np.random.Generator,
+    is_treatment: np.ndarray,
+    with_assignment: bool,
+) -> np.ndarray:
+    """Draw every user's funnel outcome as an (n, slots) count matrix.
+
+    Row u holds how many events user u emits for each journey slot, so the
+    drop-off gates are just 0/1 columns. Purely numeric: arrays in, arrays
+    out, with no Python-level loop over users.
+    """
+    n = config.num_users
+    counts = np.zeros((n, len(_SLOT_EVENT_TYPES)), dtype=np.int64)
+    counts[:, _SLOT_PAGE_VIEW] = rng.integers(
+        config.min_page_views, config.max_page_views, size=n, endpoint=True,
+    )
+    counts[:, _SLOT_CLICK] = rng.integers(
+        config.min_clicks, config.max_clicks, size=n, endpoint=True,
+    )
+    counts[:, _SLOT_ASSIGNMENT] = with_assignment
+
+    # Funnel gates (signup, onboarding, purchase) drawn as one uniform
+    # block, one row per stage; a user reaches a stage only by passing
+    # every gate before it
+    stage_prob = np.empty((3, n))
+    stage_prob[0] = config.prob_signup
+    stage_prob[1] = config.prob_onboarding
+    stage_prob[2] = np.where(
+        is_treatment,
+        min(config.prob_purchase + config.treatment_uplift, 1.0),
+        config.prob_purchase,
+    )
+    signed_up, onboarded, purchased = np.logical_and.accumulate(
+        rng.random((3, n)) < stage_prob, axis=0,
+    )
+    counts[:, _SLOT_SIGNUP] = signed_up
+    counts[:, _SLOT_PURCHASE] = purchased
+    counts[:, _SLOT_DASHBOARD] = np.where(
+        onboarded, rng.integers(*_DASHBOARD_VIEWS, size=n, endpoint=True), 0,
+    )
+    return counts
+
+
+def _simulate_user_journey_legacy(
     user_id: str,
     start_time: datetime,
     config: SimulationConfig,
@@ -59,40 +491,46 @@ def _simulate_user_journey(
     experiment: Experiment | None = None,
 ) -> list[Event]:
     """Simulate a single user's journey through the funnel."""
-    events: list[Event] = []
-    # Random arrival time within the simulation window
-    arrival_offset = timedelta(
-        seconds=rng.randint(0, config.days * 86400)
+    # Bind everything used per event to locals up front
+    randint, randrange = rng.randint, rng.randrange
+    page_view, click, signup, purchase = (
+        EventType.PAGE_VIEW, EventType.CLICK, EventType.SIGNUP, EventType.PURCHASE,
     )
-    current_time = start_time + arrival_offset
+    pools = _property_pools(config)
+    page_props, target_props = pools.pages, pools.targets
+    events: list[Event] = []
+    append = events.append
+    # Integer seconds since start_time; converted to a datetime only when
+    # an event is emitted. Starts at a random arrival within the window.
+    ts = randint(0, config.days * _SECONDS_PER_DAY)
 
     # --- Page views ---
-    num_pages = rng.randint(config.min_page_views, config.max_page_views)
+    num_pages = randint(config.min_page_views, config.max_page_views)
+    delay_low, delay_high = _PAGE_VIEW_DELAY
     for _ in range(num_pages):
-        page = rng.choice(config.pages)
-        events.append(_make_event(
-            user_id, EventType.PAGE_VIEW, current_time, rng,
-            properties={"page": page},
+        append(_make_event(
+            user_id, page_view, start_time, ts, rng,
+            properties=page_props[randrange(len(page_props))],
         ))
-        current_time += timedelta(seconds=rng.randint(5, 120))
+        ts += randint(delay_low, delay_high)
 
     # --- Clicks ---
-    num_clicks = rng.randint(config.min_clicks, config.max_clicks)
+    num_clicks = randint(config.min_clicks, config.max_clicks)
+    delay_low, delay_high = _CLICK_DELAY
     for _ in range(num_clicks):
-        target = rng.choice(config.click_targets)
-        events.append(_make_event(
-            user_id, EventType.CLICK, current_time, rng,
-            properties={"target": target},
+        append(_make_event(
+            user_id, click, start_time, ts, rng,
+            properties=target_props[randrange(len(target_props))],
         ))
-        current_time += timedelta(seconds=rng.randint(2, 30))
+        ts += randint(delay_low, delay_high)
 
     # --- Experiment assignment (deterministic, before signup gate) ---
     variant = None
     if experiment is not None:
         variant = assign_variant(experiment, user_id)
-        current_time += timedelta(seconds=rng.randint(1, 10))
-        events.append(_make_event(
-            user_id, EventType.EXPERIMENT_ASSIGNMENT, current_time, rng,
+        ts += randint(*_ASSIGNMENT_DELAY)
+        append(_make_event(
+            user_id, EventType.EXPERIMENT_ASSIGNMENT, start_time, ts, rng,
             properties={
                 "experiment_id": experiment.experiment_id,
                 "variant": variant,
@@ -103,10 +541,10 @@ def _simulate_user_journey(
     if rng.random() >= config.prob_signup:
         return events  # dropped off before signup
 
-    current_time += timedelta(seconds=rng.randint(10, 300))
-    events.append(_make_event(
-        user_id, EventType.SIGNUP, current_time, rng,
-        properties={"source": "web"},
+    ts += randint(*_SIGNUP_DELAY)
+    append(_make_event(
+        user_id, signup, start_time, ts, rng,
+        properties=_SIGNUP_PROPS,
     ))
 
     # --- Onboarding (implicit via continued engagement) ---
@@ -114,13 +552,14 @@ def _simulate_user_journey(
         return events  # dropped off after signup
 
     # More page views after onboarding
-    current_time += timedelta(seconds=rng.randint(60, 3600))
-    for _ in range(rng.randint(2, 5)):
-        events.append(_make_event(
-            user_id, EventType.PAGE_VIEW, current_time, rng,
-            properties={"page": "/dashboard"},
+    ts += randint(*_ONBOARDING_DELAY)
+    delay_low, delay_high = _DASHBOARD_DELAY
+    for _ in range(randint(*_DASHBOARD_VIEWS)):
+        append(_make_event(
+            user_id, page_view, start_time, ts, rng,
+            properties=_DASHBOARD_PROPS,
         ))
-        current_time += timedelta(seconds=rng.randint(10, 180))
+        ts += randint(delay_low, delay_high)
 
     # --- Purchase (funnel gate) ---
     # Treatment variant gets an uplift to simulate a real experiment effect
@@ -131,36 +570,75 @@ def _simulate_user_journey(
     if rng.random() >= purchase_prob:
         return events  # dropped off before purchase
 
-    current_time += timedelta(seconds=rng.randint(30, 600))
-    plan_idx = rng.choices(
-        range(len(config.plans)),
-        weights=config.plan_weights,
-        k=1,
-    )[0]
-    events.append(_make_event(
-        user_id, EventType.PURCHASE, current_time, rng,
-        properties={
-            "plan": config.plans[plan_idx],
-            "amount": config.plan_prices[plan_idx],
-        },
+    ts += randint(*_PURCHASE_DELAY)
+    # Same draw as rng.choices(..., weights=plan_weights), without
+    # rebuilding the cumulative weights for every purchase
+    plan_cum = _cumulative_weights(config.plan_weights)
+    plan_idx = bisect.bisect(
+        plan_cum, rng.random() * plan_cum[-1], hi=len(plan_cum) - 1,
+    )
+    append(_make_event(
+        user_id, purchase, start_time, ts, rng,
+        properties=pools.plans[plan_idx],
     ))
 
     return events
 
 
+def _batch_event_ids(rng: np.random.Generator, count: int) -> list[str]:
+    """Draw `count` deterministic event IDs of 128 random bits each.
+
+    All bytes come from one Generator call and are hex-encoded in one
+    binascii call; the bytes are already uniformly random, so no hash is
+    applied on top.
+    """
+    id_hex = binascii.hexlify(rng.bytes(16 * count)).decode()
+    return [id_hex[k:k + 32] for k in range(0, len(id_hex), 32)]
+
+
+class _PropertyPools(NamedTuple):
+    pages: tuple[dict, ...]
+    targets: tuple[dict, ...]
+    plans: tuple[dict, ...]
+
+
+@lru_cache(maxsize=8)
+def _property_pools(config: SimulationConfig) -> _PropertyPools:
+    """One properties dict per distinct value, shared by every event using it.
+
+    Event validation and EventsFrame both copy properties, so sharing these
+    never lets one event's properties alias another's or the pool.
+    """
+    return _PropertyPools(
+        pages=tuple({"page": p} for p in config.pages),
+        targets=tuple({"target": t} for t in config.click_targets),
+        plans=tuple(
+            {"plan": plan, "amount": price}
+            for plan, price in zip(config.plans, config.plan_prices)
+        ),
+    )
+
+
+@cache
+def _cumulative_weights(weights: tuple[float, ...]) -> tuple[float, ...]:
+    return tuple(itertools.accumulate(weights))
+
+
 def _make_event(
     user_id: str,
     event_type: EventType,
-    timestamp: datetime,
+    start_time: datetime,
+    offset: int,
     rng: random.Random,
     properties: dict | None = None,
 ) -> Event:
-    # Deterministic event ID derived from seeded RNG
-    event_id = hashlib.md5(rng.randbytes(16)).hexdigest()
+    # Deterministic event ID: 128 random bits from the seeded RNG. Hashing
+    # them again would add cost without adding uniqueness.
+    event_id = rng.randbytes(16).hex()
     return Event(
         event_id=event_id,
         user_id=user_id,
         event_type=event_type,
-        timestamp=timestamp,
+        timestamp=start_time + timedelta(seconds=offset),
         properties=properties or {},
     )
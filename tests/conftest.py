@@ -0,0 +1,22 @@
+"""Shared fixtures for the test suite."""
+
+import pytest
+
+from src.ab.experiment import PRICING_PAGE_EXPERIMENT
+from src.simulator.config import SimulationConfig
+from src.simulator.engine import generate_events
+
+
+@pytest.fixture(scope="session")
+def experiment_config():
+    """Config behind experiment_events: 200 users over 7 days, seed 42."""
+    return SimulationConfig(num_users=200, days=7, seed=42)
+
+
+@pytest.fixture(scope="session")
+def experiment_events(experiment_config):
+    """Events for experiment_config with the pricing experiment.
+
+    Generated once per session and shared read-only.
+    """
+    return generate_events(experiment_config, PRICING_PAGE_EXPERIMENT)
@@ -2,7 +2,7 @@
 
 import pytest
 
-from src.ab.assignment import assign_variant
+from src.ab.assignment import assign_variant, assign_variants_bulk
 from src.ab.experiment import Experiment, Variant, PRICING_PAGE_EXPERIMENT
 from src.collector.schemas import EventType
 from src.simulator.config import SimulationConfig
@@ -106,6 +106,18 @@ class TestAssignment:
         heavy_count = assignments.count("heavy")
         assert 8500 <= heavy_count <= 9500
 
+    def test_bulk_matches_single_assignment(self):
+        exp = Experiment(
+            experiment_id="three_way", name="Three way",
+            variants=[Variant("a", 0.2), Variant("b", 0.3), Variant("c", 0.5)],
+        )
+        user_ids = [f"user_{i}" for i in range(2000)]
+        bulk = assign_variants_bulk(exp, user_ids)
+        assert bulk.tolist() == [assign_variant(exp, uid) for uid in user_ids]
+
+    def test_bulk_empty_input(self):
+        assert len(assign_variants_bulk(PRICING_PAGE_EXPERIMENT, [])) == 0
+
 
 class TestSimulatorWithExperiment:
     SMALL_CONFIG = SimulationConfig(num_users=500, days=7, seed=42)
@@ -141,11 +153,12 @@ class TestSimulatorWithExperiment:
                 user_variant[e.user_id] = e.properties["variant"]
 
         # Count purchases per variant
+        purchasers = {e.user_id for e in events if e.event_type == EventType.PURCHASE}
         purchases = {"control": 0, "treatment": 0}
         users_per = {"control": 0, "treatment": 0}
         for uid, variant in user_variant.items():
             users_per[variant] += 1
-            if any(e.user_id == uid and e.event_type == EventType.PURCHASE for e in events):
+            if uid in purchasers:
                 purchases[variant] += 1
 
         control_rate = purchases["control"] / max(users_per["control"], 1)
@@ -153,6 +166,17 @@ class TestSimulatorWithExperiment:
         # Treatment should have higher or equal purchase rate
         assert treatment_rate >= control_rate
 
+    def test_purchasers_signed_up_and_were_assigned(self):
+        """Every purchasing user passed through assignment and signup first."""
+        events = generate_events(self.SMALL_CONFIG, PRICING_PAGE_EXPERIMENT)
+        users_by_type = {t: set() for t in EventType}
+        for e in events:
+            users_by_type[e.event_type].add(e.user_id)
+        purchasers = users_by_type[EventType.PURCHASE]
+        assert purchasers
+        assert purchasers <= users_by_type[EventType.SIGNUP]
+        assert purchasers <= users_by_type[EventType.EXPERIMENT_ASSIGNMENT]
+
     def test_no_experiment_means_no_assignment_events(self):
         events = generate_events(self.SMALL_CONFIG)
         exp_events = [e for e in events if e.event_type == EventType.EXPERIMENT_ASSIGNMENT]
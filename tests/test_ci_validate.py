@@ -1,10 +1,14 @@
 """Tests for CI analytics validation script."""
 
-from ci.validate_analytics import validate
+import json
+
+from ci.validate_analytics import ErrCode, validate, validate_stream
 
 
 def _valid_data():
     """Return minimal valid dashboard data."""
+    # Built fresh per call: evaluating the literal is cheaper than
+    # deepcopy or json.loads of a shared template, and tests mutate it
     return {
         "event_summary": [
             {"event_type": "page_view", "count": 1000, "unique_users": 500},
@@ -38,22 +42,40 @@ def _valid_data():
     }
 
 
+def assert_first_error(data: dict, code: ErrCode) -> None:
+    """Assert that the first validation error of data has the given code."""
+    errors = validate(data, fail_fast=True)
+    assert errors.codes == {code}, errors
+
+
 class TestValidate:
     def test_valid_data_passes(self):
         errors = validate(_valid_data())
         assert errors == []
 
+    def test_fail_fast_returns_first_error(self):
+        data = _valid_data()
+        data["funnel"] = []
+        data["experiments"] = []
+        assert validate(data, fail_fast=True) == ["funnel is empty — no funnel data exported"]
+        assert len(validate(data)) == 2
+
+    def test_errors_are_coded_message_strings(self):
+        data = _valid_data()
+        data["experiments"][0]["analysis"]["p_value"] = 1.5
+        [error] = validate(data)
+        assert error.code is ErrCode.P_VALUE_OUT_OF_RANGE
+        assert error == "Experiment exp_1 p-value out of range: 1.5"
+
     def test_missing_top_level_key(self):
         data = _valid_data()
         del data["funnel"]
-        errors = validate(data)
-        assert any("Missing top-level key: funnel" in e for e in errors)
+        assert_first_error(data, ErrCode.MISSING_TOP_KEY)
 
     def test_empty_event_summary(self):
         data = _valid_data()
         data["event_summary"] = []
-        errors = validate(data)
-        assert any("event_summary is empty" in e for e in errors)
+        assert_first_error(data, ErrCode.EMPTY_EVENT_SUMMARY)
 
     def test_missing_required_event_type(self):
         data = _valid_data()
@@ -61,55 +83,140 @@ class TestValidate:
             {"event_type": "page_view", "count": 100, "unique_users": 50},
         ]
         errors = validate(data)
-        assert any("missing required type: signup" in e for e in errors)
+        assert ErrCode.MISSING_EVENT_TYPE in errors.codes
+        assert errors[:2] == [
+            "event_summary missing required type: signup",
+            "event_summary missing required type: purchase",
+        ]
 
     def test_empty_funnel(self):
         data = _valid_data()
         data["funnel"] = []
+        assert_first_error(data, ErrCode.EMPTY_FUNNEL)
+
+    def test_funnel_unexpected_steps(self):
+        data = _valid_data()
+        data["funnel"][1]["step"] = "onboarding"
         errors = validate(data)
-        assert any("funnel is empty" in e for e in errors)
+        assert ErrCode.UNEXPECTED_FUNNEL_STEPS in errors.codes
+        assert (
+            "Funnel steps ['page_view', 'onboarding', 'purchase'] "
+            "!= expected ['page_view', 'signup', 'purchase']"
+        ) in errors
 
     def test_funnel_wrong_order(self):
         data = _valid_data()
         data["funnel"][0]["users"] = 100
         data["funnel"][1]["users"] = 200  # Increasing = bad
+        assert_first_error(data, ErrCode.FUNNEL_NOT_MONOTONIC)
+
+    def test_funnel_reports_each_increase(self):
+        data = _valid_data()
+        data["funnel"][1]["users"] = 600
+        data["funnel"][2]["users"] = 700
+        errors = validate(data)
+        assert [e.code for e in errors] == [ErrCode.FUNNEL_NOT_MONOTONIC] * 2
+
+    def test_funnel_fractional_increase(self):
+        data = _valid_data()
+        data["funnel"][2]["users"] = 200.5
+        errors = validate(data)
+        assert "Funnel not monotonically decreasing: signup=200 < purchase=200.5" in errors
+
+    def test_funnel_null_users(self):
+        data = _valid_data()
+        data["funnel"][1]["users"] = None
+        errors = validate(data)
+        assert errors == ["Funnel step signup has invalid user count: None"]
+        assert errors.codes == {ErrCode.INVALID_FUNNEL_USERS}
+
+    def test_funnel_invalid_rate(self):
+        data = _valid_data()
+        data["funnel"][2]["conversion_rate_pct"] = 120.0
         errors = validate(data)
-        assert any("monotonically decreasing" in e for e in errors)
+        assert "Funnel step purchase has invalid rate: 120.0%" in errors
+
+    def test_funnel_non_numeric_rate(self):
+        data = _valid_data()
+        data["funnel"][1]["conversion_rate_pct"] = None
+        data["funnel"][2]["conversion_rate_pct"] = "50"
+        errors = validate(data)
+        assert errors == [
+            "Funnel step signup has invalid rate: None%",
+            "Funnel step purchase has invalid rate: 50%",
+        ]
+        assert errors.codes == {ErrCode.INVALID_CONVERSION_RATE}
 
     def test_empty_experiments(self):
         data = _valid_data()
         data["experiments"] = []
-        errors = validate(data)
-        assert any("experiments is empty" in e for e in errors)
+        assert_first_error(data, ErrCode.EMPTY_EXPERIMENTS)
+
+    def test_null_experiments(self):
+        data = _valid_data()
+        data["experiments"] = None
+        assert_first_error(data, ErrCode.EMPTY_EXPERIMENTS)
 
     def test_missing_control_variant(self):
         data = _valid_data()
         data["experiments"][0]["variants"] = [
             {"name": "treatment", "users": 250, "conversions": 30, "conversion_rate": 0.12},
         ]
-        errors = validate(data)
-        assert any("missing 'control'" in e for e in errors)
+        assert_first_error(data, ErrCode.MISSING_VARIANT)
 
     def test_missing_analysis(self):
         data = _valid_data()
         del data["experiments"][0]["analysis"]
-        errors = validate(data)
-        assert any("missing analysis results" in e for e in errors)
+        assert_first_error(data, ErrCode.MISSING_ANALYSIS)
 
     def test_invalid_p_value(self):
         data = _valid_data()
         data["experiments"][0]["analysis"]["p_value"] = 1.5
-        errors = validate(data)
-        assert any("p-value out of range" in e for e in errors)
+        assert_first_error(data, ErrCode.P_VALUE_OUT_OF_RANGE)
 
     def test_invalid_decision(self):
         data = _valid_data()
         data["experiments"][0]["analysis"]["decision"] = "MAYBE"
-        errors = validate(data)
-        assert any("invalid decision" in e for e in errors)
+        assert_first_error(data, ErrCode.INVALID_DECISION)
 
     def test_zero_users_in_variant(self):
         data = _valid_data()
         data["experiments"][0]["variants"][0]["users"] = 0
-        errors = validate(data)
-        assert any("0 users" in e for e in errors)
+        assert_first_error(data, ErrCode.EMPTY_VARIANT)
+
+
+class TestValidateStream:
+    def test_valid_file_passes(self, tmp_path):
+        path = tmp_path / "data.json"
+        path.write_text(json.dumps(_valid_data()))
+        assert validate_stream(path) == []
+
+    def test_matches_in_memory_validation(self, tmp_path):
+        data = _valid_data()
+        data["funnel"][0]["users"] = 100
+        data["funnel"][1]["users"] = 200
+        data["experiments"][0]["analysis"]["p_value"] = 1.5
+        path = tmp_path / "data.json"
+        path.write_text(json.dumps(data))
+        assert validate_stream(path) == validate(data)
+
+    def test_missing_top_level_key(self, tmp_path):
+        data = _valid_data()
+        del data["experiments"]
+        path = tmp_path / "data.json"
+        path.write_text(json.dumps(data))
+        assert validate_stream(path) == ["Missing top-level key: experiments"]
+
+    def test_empty_experiments(self, tmp_path):
+        data = _valid_data()
+        data["experiments"] = []
+        path = tmp_path / "data.json"
+        path.write_text(json.dumps(data))
+        assert ErrCode.EMPTY_EXPERIMENTS in validate_stream(path).codes
+
+    def test_null_experiments(self, tmp_path):
+        data = _valid_data()
+        data["experiments"] = None
+        path = tmp_path / "data.json"
+        path.write_text(json.dumps(data))
+        assert validate_stream(path).codes == {ErrCode.EMPTY_EXPERIMENTS}
@@ -5,23 +5,21 @@ from pathlib import Path
 
 import pytest
 
-from src.ab.experiment import PRICING_PAGE_EXPERIMENT
 from src.analysis.export import export_dashboard_data
-from src.simulator.config import SimulationConfig
-from src.simulator.engine import generate_events
 from src.warehouse.db import get_connection, init_db, insert_events
 
 
-@pytest.fixture()
-def populated_db(tmp_path):
-    """Create an in-memory DB with simulated events including experiment."""
-    db_path = str(tmp_path / "test.duckdb")
+@pytest.fixture(scope="module")
+def populated_db(tmp_path_factory, experiment_events):
+    """Create a DB with simulated events including experiment.
+
+    Built once per module; exports only read from it.
+    """
+    db_path = str(tmp_path_factory.mktemp("export") / "test.duckdb")
     conn = get_connection(db_path)
     init_db(conn)
 
-    config = SimulationConfig(num_users=200, days=7, seed=42)
-    events = generate_events(config, PRICING_PAGE_EXPERIMENT)
-    rows = [e.model_dump(mode="json") for e in events]
+    rows = [e.model_dump(mode="json") for e in experiment_events]
     insert_events(conn, rows)
     conn.close()
     return db_path
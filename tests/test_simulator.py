@@ -1,17 +1,50 @@
 """Tests for the user behavior simulator."""
 
+import json
+from collections import Counter
+from itertools import pairwise
+
+import numpy as np
+import pytest
+
+from src.ab.experiment import PRICING_PAGE_EXPERIMENT
 from src.collector.schemas import EventType
 from src.simulator.config import SimulationConfig
-from src.simulator.engine import generate_events
+from src.simulator.engine import (
+    generate_event_columns,
+    generate_events,
+    generate_events_frame,
+)
 
 
 # Small config for fast tests
 SMALL_CONFIG = SimulationConfig(num_users=200, days=7, seed=42)
 
+FUNNEL_STAGES = frozenset({
+    EventType.PAGE_VIEW, EventType.CLICK, EventType.SIGNUP, EventType.PURCHASE,
+})
+
+
+@pytest.fixture(scope="session")
+def events():
+    """Events for SMALL_CONFIG, generated once and shared read-only."""
+    return generate_events(SMALL_CONFIG)
+
+
+@pytest.fixture(scope="session")
+def legacy_events():
+    """Legacy-path events for SMALL_CONFIG, generated once and shared read-only."""
+    return generate_events(SMALL_CONFIG, vectorized=False)
+
+
+@pytest.fixture(scope="session")
+def frame():
+    """EventsFrame for SMALL_CONFIG, generated once and shared read-only."""
+    return generate_events_frame(SMALL_CONFIG)
+
 
 class TestGenerateEvents:
-    def test_generates_events(self):
-        events = generate_events(SMALL_CONFIG)
+    def test_generates_events(self, events):
         assert len(events) > 0
 
     def test_deterministic_with_same_seed(self):
@@ -29,49 +62,127 @@ class TestGenerateEvents:
         ids_b = {e.event_id for e in events_b}
         assert ids_a != ids_b
 
-    def test_events_sorted_by_timestamp(self):
-        events = generate_events(SMALL_CONFIG)
-        timestamps = [e.timestamp for e in events]
-        assert timestamps == sorted(timestamps)
+    def test_events_sorted_by_timestamp(self, events):
+        assert all(a.timestamp <= b.timestamp for a, b in pairwise(events))
 
-    def test_all_event_ids_unique(self):
-        events = generate_events(SMALL_CONFIG)
+    def test_all_event_ids_unique(self, events):
         ids = [e.event_id for e in events]
         assert len(ids) == len(set(ids))
 
-    def test_contains_all_funnel_stages(self):
-        events = generate_events(SMALL_CONFIG)
-        types = {e.event_type for e in events}
-        assert EventType.PAGE_VIEW in types
-        assert EventType.CLICK in types
-        assert EventType.SIGNUP in types
-        assert EventType.PURCHASE in types
-
-    def test_funnel_has_natural_dropoff(self):
-        events = generate_events(SMALL_CONFIG)
-        type_counts = {}
+    def test_event_ids_are_128_bit_hex(self, events):
         for e in events:
-            type_counts[e.event_type] = type_counts.get(e.event_type, 0) + 1
+            assert len(e.event_id) == 32
+            int(e.event_id, 16)
+
+    def test_contains_all_funnel_stages(self, events):
+        assert FUNNEL_STAGES <= {e.event_type for e in events}
+
+    def test_funnel_has_natural_dropoff(self, events):
+        type_counts = Counter(e.event_type for e in events)
         # More page views than signups, more signups than purchases
         assert type_counts[EventType.PAGE_VIEW] > type_counts[EventType.SIGNUP]
         assert type_counts[EventType.SIGNUP] > type_counts[EventType.PURCHASE]
 
-    def test_user_ids_follow_pattern(self):
-        events = generate_events(SMALL_CONFIG)
+    def test_user_ids_follow_pattern(self, events):
         for e in events:
             assert e.user_id.startswith("user_")
 
-    def test_page_view_has_page_property(self):
-        events = generate_events(SMALL_CONFIG)
+    def test_page_view_has_page_property(self, events):
         page_views = [e for e in events if e.event_type == EventType.PAGE_VIEW]
         for pv in page_views:
             assert "page" in pv.properties
 
-    def test_purchase_has_plan_and_amount(self):
-        events = generate_events(SMALL_CONFIG)
+    def test_purchase_has_plan_and_amount(self, events):
         purchases = [e for e in events if e.event_type == EventType.PURCHASE]
         assert len(purchases) > 0
         for p in purchases:
             assert "plan" in p.properties
             assert "amount" in p.properties
             assert p.properties["amount"] > 0
+
+
+class TestLegacyPath:
+    def test_deterministic_with_same_seed(self):
+        events_a = generate_events(SMALL_CONFIG, vectorized=False)
+        events_b = generate_events(SMALL_CONFIG, vectorized=False)
+        assert [e.event_id for e in events_a] == [e.event_id for e in events_b]
+
+    def test_contains_all_funnel_stages(self, legacy_events):
+        assert FUNNEL_STAGES <= {e.event_type for e in legacy_events}
+
+    def test_events_sorted_by_timestamp(self, legacy_events):
+        assert all(a.timestamp <= b.timestamp for a, b in pairwise(legacy_events))
+
+
+class TestEventsFrame:
+    def test_to_events_matches_generate_events(self, experiment_config, experiment_events):
+        frame = generate_events_frame(experiment_config, PRICING_PAGE_EXPERIMENT)
+        assert len(frame) == len(experiment_events)
+        assert [
+            (e.event_id, e.event_type, e.properties) for e in frame.to_events()
+        ] == [(e.event_id, e.event_type, e.properties) for e in experiment_events]
+
+    def test_iterates_event_views(self, frame):
+        events = frame.to_events()
+        for view, event in zip(frame, events):
+            assert view.event_id == event.event_id
+            assert view.user_id == event.user_id
+            assert view.event_type == event.event_type
+            assert view.timestamp == event.timestamp
+            assert view.properties == event.properties
+
+    def test_contains_all_funnel_stages(self, frame):
+        assert {t.value for t in FUNNEL_STAGES} <= set(frame.event_type.tolist())
+
+    def test_funnel_has_natural_dropoff(self, frame):
+        stages = np.array([
+            EventType.PAGE_VIEW.value, EventType.SIGNUP.value, EventType.PURCHASE.value,
+        ])
+        # One broadcast comparison: row k counts the events of stage k
+        counts = (frame.event_type == stages[:, None]).sum(axis=1)
+        assert (counts[:-1] > counts[1:]).all()
+
+    def test_events_sorted_by_timestamp(self, frame):
+        assert (np.diff(frame.timestamp.astype(np.int64)) >= 0).all()
+
+    def test_all_event_ids_unique(self, frame):
+        assert np.unique(frame.event_id).size == frame.event_id.size
+
+    def test_mutating_a_row_does_not_leak(self):
+        config = SimulationConfig(num_users=50, days=7, seed=7)
+        frame = generate_events_frame(config)
+        row = int(np.flatnonzero(frame.by_type(EventType.PAGE_VIEW))[0])
+        frame.properties[row]["page"] = "/mutated"
+
+        assert sum(p.get("page") == "/mutated" for p in frame.properties) == 1
+        assert "/mutated" not in {p.get("page") for p in generate_events_frame(config).properties}
+        assert not any("/mutated" in p for p in generate_event_columns(config)["properties"])
+        legacy = generate_events(config, vectorized=False)
+        assert "/mutated" not in {e.properties.get("page") for e in legacy}
+
+    def test_compares_by_identity(self, frame):
+        other = generate_events_frame(SMALL_CONFIG)
+        assert frame != other
+        assert len({frame, other}) == 2
+
+    def test_by_type_masks_rows(self, frame):
+        mask = frame.by_type(EventType.PURCHASE)
+        assert mask.any()
+        assert all(p.keys() == {"plan", "amount"} for p in np.array(frame.properties)[mask])
+
+
+class TestGenerateEventColumns:
+    def test_matches_generate_events(self, experiment_config, experiment_events):
+        columns = generate_event_columns(experiment_config, PRICING_PAGE_EXPERIMENT)
+        assert columns["event_id"].tolist() == [e.event_id for e in experiment_events]
+        assert columns["user_id"].tolist() == [e.user_id for e in experiment_events]
+        assert columns["event_type"].tolist() == [e.event_type.value for e in experiment_events]
+        assert [json.loads(p) for p in columns["properties"]] == [
+            e.properties for e in experiment_events
+        ]
+
+    def test_timestamps_are_sorted_microseconds(self):
+        columns = generate_event_columns(SMALL_CONFIG)
+        timestamps = columns["timestamp"]
+        assert timestamps.dtype == "datetime64[us]"
+        assert (timestamps[1:] >= timestamps[:-1]).all()
@@ -1,10 +1,17 @@
 """Tests for the DuckDB warehouse layer."""
 
-from datetime import datetime, timezone
+from datetime import UTC, datetime, timezone
 
+import numpy as np
 import pytest
 
-from src.warehouse.db import count_events, get_connection, init_db, insert_events
+from src.warehouse.db import (
+    count_events,
+    get_connection,
+    init_db,
+    insert_event_columns,
+    insert_events,
+)
 
 
 @pytest.fixture
@@ -74,6 +81,13 @@ class TestInsertEvents:
         assert inserted == 0
         assert dupes == 0
 
+    def test_duplicate_within_batch(self, db):
+        batch = [_make_event("evt_1"), _make_event("evt_1"), _make_event("evt_2")]
+        inserted, dupes = insert_events(db, batch)
+        assert inserted == 2
+        assert dupes == 1
+        assert count_events(db) == 2
+
     def test_properties_stored_as_json(self, db):
         event = _make_event()
         event["properties"] = {"amount": 49.99, "currency": "USD"}
@@ -89,3 +103,37 @@ class TestInsertEvents:
             "SELECT ingested_at FROM raw_events WHERE event_id = 'evt_1'"
         ).fetchone()
         assert row[0] is not None
+
+
+def _make_columns(event_ids: list[str]) -> dict:
+    n = len(event_ids)
+    return {
+        "event_id": np.array(event_ids, dtype=object),
+        "user_id": np.array(["user_1"] * n, dtype=object),
+        "event_type": np.array(["page_view"] * n, dtype=object),
+        "timestamp": np.full(n, np.datetime64("2024-01-02T03:04:05.123456", "us")),
+        "properties": np.array(['{"page": "/home"}'] * n, dtype=object),
+    }
+
+
+class TestInsertEventColumns:
+    def test_insert_columns(self, db):
+        inserted, dupes = insert_event_columns(db, _make_columns(["evt_1", "evt_2"]))
+        assert inserted == 2
+        assert dupes == 0
+        assert count_events(db) == 2
+
+    def test_duplicates_skipped(self, db):
+        insert_event_columns(db, _make_columns(["evt_1"]))
+        inserted, dupes = insert_event_columns(db, _make_columns(["evt_1", "evt_2", "evt_2"]))
+        assert inserted == 1
+        assert dupes == 2
+        assert count_events(db) == 2
+
+    def test_datetime64_stored_as_utc(self, db):
+        insert_event_columns(db, _make_columns(["evt_1"]))
+        row = db.execute("SELECT timestamp FROM raw_events").fetchone()
+        assert row[0] == datetime(2024, 1, 2, 3, 4, 5, 123456, tzinfo=UTC)
+
+    def test_empty_columns(self, db):
+        assert insert_event_columns(db, _make_columns([])) == (0, 0)